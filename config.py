@@ -33,6 +33,14 @@ HUMP_PENALTY = 0.5    # e^β penalty per extra slope sign change
 CD_FACE      = 0.40   # k-factor for rotating end-disk drag
 SEED        = 2       # random seed for reproducibility
 
+# ===========================
+# Warm Start
+# ===========================
+WARM_START_LOGS = []    # *_full.csv paths/globs, e.g. ["logs/*_full.csv"]; [] → cold start
+WARM_N          = 50    # max elites carried over (rest are random immigrants)
+WARM_MIN_DIST   = 0.05  # min radii distance (m) between carried-over elites
+WARM_POOL_K     = 4     # per-log candidate pool = WARM_POOL_K × WARM_N
+
 # ===========================
 # Weights
 # ===========================
@@ -11,10 +11,12 @@ import hitl_pygame as hitl   # swap to ascii hitl if needed
 
 
 # ────────────────────────────────────────────────────────────────────
-def run_experiment(exp_id: str, k_eval: int, seed: int) -> None:
+def run_experiment(exp_id: str, k_eval: int, seed: int,
+                   warm_logs: list | None = None) -> None:
     np.random.seed(seed)
 
-    pop = Population(C.N)
+    warm_logs = C.WARM_START_LOGS if warm_logs is None else warm_logs
+    pop = Population.from_logs(C.N, warm_logs) if warm_logs else Population(C.N)
     logger = ExperimentLogger(exp_id=exp_id, seed=seed, k_eval=k_eval)
 
     for gen in range(1, C.G + 1):
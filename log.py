@@ -1,6 +1,7 @@
 # log.py
+import glob
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable
 
 import pandas as pd
 import numpy as np
@@ -80,3 +81,84 @@ class ExperimentLogger:
 
         print(f"[logger] saved {len(full)} rows → {full_path}")
         print(f"[logger] saved {len(summary)} rows → {summ_path}")
+
+
+# ────────────────────────────────────────────────────────────────────
+# Warm-start: read back *_full.csv logs
+# ────────────────────────────────────────────────────────────────────
+def select_diverse(df: pd.DataFrame, n: int, min_dist: float) -> pd.DataFrame:
+    """
+    Greedy elite pick: walk rows by descending t_spin and keep a row only if
+    its radii are at least `min_dist` (Euclidean, as in `diversity()`) away
+    from every row already kept.  Stops after `n` rows.
+    """
+    radii_cols = [f"r_{i}" for i in range(C.K)]
+    df = df.sort_values("t_spin", ascending=False, kind="stable")
+    R = df[radii_cols].to_numpy(dtype=float)
+
+    kept: List[int] = []
+    for i in range(len(R)):
+        if len(kept) >= n:
+            break
+        if kept:
+            d2 = ((R[kept] - R[i]) ** 2).sum(-1)
+            if d2.min() < min_dist ** 2:
+                continue
+        kept.append(i)
+    return df.iloc[kept]
+
+
+def load_elites(sources: Iterable[str], n: int, min_dist: float,
+                pool_k: int | None = None) -> pd.DataFrame:
+    """
+    Load `*_full.csv` logs (paths or glob patterns) and return up to `n`
+    diverse top-t_spin rows with columns t_spin, h_anchor, r_0..r_{K-1}.
+
+    h_anchor is NaN unless the row has a human signal:
+      • older logs: the per-row `h_score` rating, where set;
+      • newer logs: the logged `h_anchor`, but only for runs with k_eval > 0.
+        This is a run-level filter – inside a HITL run it also keeps
+        mean-filled and inherited (decayed) anchors, not just fresh ratings.
+
+    Each file is first cut to a diverse pool of `pool_k`·n rows (default
+    C.WARM_POOL_K), then the merged pools are picked again.  This keeps
+    memory bounded by files × pool size but is an approximation of the
+    global greedy pick: a row dropped inside its own file can be the right
+    global choice, so a larger `pool_k` tracks the exact result more closely.
+    """
+    if pool_k is None:
+        pool_k = C.WARM_POOL_K
+
+    paths: List[str] = []
+    for src in sources:
+        hits = sorted(glob.glob(str(src)))
+        paths.extend(hits if hits else [str(src)])
+    paths = list(dict.fromkeys(paths))                   # keep order, drop dups
+    if not paths:
+        raise FileNotFoundError("No warm-start logs given.")
+
+    radii_cols = [f"r_{i}" for i in range(C.K)]
+    wanted = {"t_spin", "k_eval", "h_anchor", "h_score", *radii_cols}
+
+    per_file = []
+    for path in paths:
+        df = pd.read_csv(path, usecols=lambda c: c in wanted)
+        missing = [c for c in ["t_spin", *radii_cols] if c not in df.columns]
+        if missing:
+            raise ValueError(f"{path}: missing columns {missing} (K={C.K}?)")
+
+        anchor = pd.Series(np.nan, index=df.index)
+        if "k_eval" in df.columns and "h_anchor" in df.columns:
+            anchor = df["h_anchor"].where(df["k_eval"] > 0)
+        if "h_score" in df.columns:                      # older logs
+            anchor = df["h_score"].combine_first(anchor)
+        df["h_anchor"] = anchor
+        df = df[["t_spin", "h_anchor", *radii_cols]]
+
+        df = df.dropna(subset=["t_spin"])
+        # converged generations repeat the same elites many times over
+        df = df.loc[~df[radii_cols].round(6).duplicated()]
+        per_file.append(select_diverse(df, pool_k * n, min_dist))
+
+    merged = pd.concat(per_file, ignore_index=True)
+    return select_diverse(merged, n, min_dist).reset_index(drop=True)
@@ -1,9 +1,10 @@
 import numpy as np
 import pandas as pd
-from typing import List
+from typing import List, Iterable
 
 import config as C
 from shape import Shape
+from log import load_elites
 
 class Population:
 
@@ -11,6 +12,43 @@ class Population:
         self.shapes: List[Shape] = [Shape() for _ in range(size)]
         self.generation = 1
 
+    @classmethod
+    def from_logs(cls, size: int, sources: Iterable[str],
+                  n_elite: int | None = None,
+                  min_dist: float | None = None) -> "Population":
+        """Seed from diverse top-t_spin shapes of earlier runs' full logs.
+
+        Elites with a logged human signal (see `load_elites`) keep their
+        h_anchor, pinned to the shape's own radii since anchor_r is not
+        logged.  Remaining slots are filled with random immigrants.
+        """
+        if n_elite is None:
+            n_elite = C.WARM_N
+        if min_dist is None:
+            min_dist = C.WARM_MIN_DIST
+        n_elite = min(n_elite, size)
+        if n_elite <= 0:
+            return cls(size)
+
+        radii_cols = [f"r_{i}" for i in range(C.K)]
+        elites = load_elites(sources, n_elite, min_dist)
+
+        pop = cls(0)
+        R = np.clip(elites[radii_cols].to_numpy(dtype=float), C.B_MIN, C.B_MAX)
+        for r, anchor in zip(R, elites["h_anchor"].to_numpy(dtype=float)):
+            sh = Shape(r.copy())
+            if not np.isnan(anchor):
+                sh.h_anchor = float(anchor)
+                sh.anchor_r = sh.radii.copy()
+                sh.update_guard()
+            pop.shapes.append(sh)
+
+        while len(pop.shapes) < size:
+            pop.shapes.append(Shape())
+        print(f"[warm-start] {len(elites)} elites + "
+              f"{size - len(elites)} immigrants")
+        return pop
+
     def evaluate(self) -> None:
         """Compute t_spin for every Shape."""
         for s in self.shapes:
@@ -3,6 +3,7 @@ import config as C
 seed=C.SEED
 exp_id = "HITL"
 k_eval = 4
+warm_logs = C.WARM_START_LOGS   # e.g. ["logs/*_full.csv"]; [] → cold start
 
 if __name__ == "__main__":
-    run_experiment(exp_id=exp_id, k_eval=k_eval, seed=seed)
\ No newline at end of file
+    run_experiment(exp_id=exp_id, k_eval=k_eval, seed=seed, warm_logs=warm_logs)
\ No newline at end of file